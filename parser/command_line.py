@@ -1,26 +1,37 @@
-from parser.structured_params import TypeAParser, TypeBParser, TypeCParser
+from parser.structured_params import BasePandasParams, TypeAParser, TypeBParser, TypeCParser
 from parser.unstructured_params import TypeDParser, UnstructuredParser
 from parser.utils import namespace_to_data_class
-from argparse import ArgumentParser, Namespace
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from parser.common_params import FileParams
 import logging
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
 def build_parser(description: str = None) -> ArgumentParser:
     parser = ArgumentParser(description)
     parser.add_argument("--verbose", action="count", default=0)
     parser.add_argument("--dry-run", action="count", default=0)
+    # structured parsers only: read N rows, run the pipeline and log schema, rows and projected cost
+    parser.add_argument("--preview-rows", type=positive_int, default=None)
+    parser.add_argument("--preview-sample", action="count", default=0)
+    parser.add_argument("--preview-seed", type=int, default=None)
 
     common_parser = ArgumentParser(add_help=False)
     common_parser.add_argument("--file-path", required=True)
     common_parser.add_argument("--output-path", required=True)
     # TODO: Implement write to csv, txt
-    common_parser.add_argument("--output-type", default="json", choices=["json", "csv"])
+    common_parser.add_argument("--output-type", default="json", choices=["json", "jsonl", "csv"])
     # TODO: Implement read pdf
     common_parser.add_argument(
         "--file-type",
         default="xlsx",
-        choices=["json", "xlsx", "xls", "doc", "docx", "csv", "txt"],
+        choices=["json", "jsonl", "xlsx", "xls", "doc", "docx", "csv", "txt"],
         required=False,
     )
 
@@ -40,12 +51,21 @@ def main():
     parser: ArgumentParser = build_parser()
     args: Namespace = parser.parse_args()
     commands = dict(
-        type_a=TypeAParser, type_b=TypeBParser, type_c=TypeDParser, type_d=TypeDParser, unstructured=UnstructuredParser,
+        type_a=TypeAParser, type_b=TypeBParser, type_c=TypeCParser, type_d=TypeDParser, unstructured=UnstructuredParser,
     )
     action = commands[args.command]
+    if args.preview_rows and not issubclass(action, BasePandasParams):
+        parser.error(f"--preview-rows is only supported for structured parsers, not {args.command}")
+    if (args.preview_sample or args.preview_seed is not None) and not args.preview_rows:
+        parser.error("--preview-sample and --preview-seed require --preview-rows")
+    if args.file_type == "jsonl" and args.command != "type_d":
+        parser.error(f"--file-type jsonl is only supported for type_d, not {args.command}")
+    if (args.file_type == "jsonl") != (args.output_type == "jsonl"):
+        parser.error("--file-type jsonl and --output-type jsonl must be used together")
     file_params = namespace_to_data_class(args, FileParams)
     for built_file_params in file_params.get_file_path():
         parser_built = namespace_to_data_class(args, action, additional=built_file_params)
         logging.info(f'parsing file: {built_file_params["input_file"]}')
         parser_built.parse()
-        logging.info(f'saved to: {built_file_params["output_file"]}')
+        if not args.preview_rows:
+            logging.info(f'saved to: {built_file_params["output_file"]}')
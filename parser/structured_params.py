@@ -1,12 +1,13 @@
 from parser.utils import (
     apply_lambda, date_to_str, create_column, set_columns, drop_columns, add_to_pipe, write_to_json,
-    write_iterrow_to_json,
+    write_iterrow_to_json, count_csv_rows, build_preview_read_kwargs, log_preview,
 )
 from pandas import DataFrame, read_csv, read_excel, read_json
 from parser.common_params import CommonParams
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Any
 from datetime import datetime
+from time import perf_counter
 from hashlib import md5
 import logging
 
@@ -22,11 +23,29 @@ class BasePandasParams(CommonParams):
            pandas dataframe object
        available_read_type : Dict
            contains available pandas read functions
+       available_row_counters : Dict
+           contains functions that count rows in a file without parsing it, used to project preview costs
+       preview_rows : int
+           if set, only this many rows are read and the pipeline output is previewed instead of written
+       preview_sample : int
+           if true, preview rows are drawn at random across the file instead of taken from the top
+       preview_seed : int
+           seed for preview_sample, makes sampled previews reproducible
+       total_rows : int
+           number of rows in the full file, when it can be counted cheaply
+       stage_timings : List[Tuple]
+           (stage, seconds, scaled) for the row count, the read and each pipeline action,
+           scaled is false for stages that already covered the full file
 
        Methods
        -------
+        count_rows()
+            counts rows in the full file with available row counters, None if the file type has none
+        reads_full_file()
+            whether get_df has to go through every row of the file
         get_df()
-            utilizes available read types to determine which pandas read function to use
+            utilizes available read types to determine which pandas read function to use,
+            only reads preview rows when preview_rows is set
         write_json()
             writes the dataframe to json
         inject_data(action)
@@ -35,6 +54,7 @@ class BasePandasParams(CommonParams):
         parse():
             iterates over each action in the pipeline and calls add to pipe utility function
             once all operations from the pipeline have been applied, the method write_json is called
+            in preview mode, logs the output schema, a few rows and projected cost per stage instead
    """
 
     df: DataFrame = None
@@ -43,15 +63,54 @@ class BasePandasParams(CommonParams):
             csv=read_csv, xls=read_excel, xlsx=read_excel, json=read_json
         )
     )
+    available_row_counters: Dict = field(default_factory=dict(csv=count_csv_rows))
     write_to_file: Any = field(default_factory=write_to_json)
+    preview_rows: int = None
+    preview_sample: int = 0
+    preview_seed: int = None
+    total_rows: int = None
+    stage_timings: List[Tuple] = None
 
     def __post_init__(self):
+        super().__post_init__()
+        self.stage_timings = []
+        if self.preview_rows:
+            self.total_rows = self.count_rows()
+        start = perf_counter()
         self.df = self.get_df()
+        self.stage_timings.append(("read", perf_counter() - start, not self.reads_full_file()))
+
+    def count_rows(self) -> int:
+        row_counter = self.available_row_counters.get(self.file_type)
+        if not row_counter:
+            return None
+        start = perf_counter()
+        total_rows = row_counter(self.input_file)
+        self.stage_timings.append(("row count", perf_counter() - start, False))
+        return total_rows
+
+    def reads_full_file(self) -> bool:
+        # read_json cannot limit rows, sampling without a row count needs a full read,
+        # and a sampled read still tokenizes every line through skiprows
+        return not self.preview_rows or self.file_type == "json" or bool(self.preview_sample)
 
     def get_df(self) -> DataFrame:
         logging.debug(f" Pandas file reader: reading file type {self.file_type}")
         df_reader = self.available_read_types[self.file_type]
-        return df_reader(self.input_file)
+        if not self.preview_rows:
+            return df_reader(self.input_file)
+        if self.file_type == "json" or (self.preview_sample and self.total_rows is None):
+            logging.debug(f" Pandas file reader: cannot preview {self.file_type} at reader level, reading full file")
+            df = df_reader(self.input_file)
+            self.total_rows = len(df)
+        else:
+            read_kwargs = build_preview_read_kwargs(
+                self.preview_rows, self.total_rows, bool(self.preview_sample), self.preview_seed
+            )
+            df = df_reader(self.input_file, **read_kwargs)
+        if self.preview_sample:
+            return df.sample(min(self.preview_rows, len(df)), random_state=self.preview_seed).sort_index()
+        return df.head(self.preview_rows)
 
     def inject_data(self, action: Dict) -> Dict:
         action["data_attr"] = self.__dict__[action["data_attr"]]
@@ -60,12 +119,17 @@ class BasePandasParams(CommonParams):
 
     def parse(self):
         for action in self.pipeline:
-            logging.debug(f' Running action {action["data_attr"]} for {self.input_file}')
+            stage = action["data_attr"]
+            logging.debug(f" Running action {stage} for {self.input_file}")
             action = self.inject_data(action)
+            start = perf_counter()
             self.df = add_to_pipe(**action)
+            self.stage_timings.append((stage, perf_counter() - start, True))
         logging.debug(f"All actions completed for {self.input_file}")
         self.df = self.df.fillna("")
-        if not self.dry_run:
+        if self.preview_rows:
+            log_preview(self.df, self.stage_timings, len(self.df), self.total_rows)
+        elif not self.dry_run:
             logging.debug(f" Writing {self.input_file} to file {self.output_file}")
             self.write_to_file(self.df, self.output_file)
         else:
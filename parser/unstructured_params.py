@@ -1,12 +1,14 @@
 from parser.common_params import CommonParams
 from dataclasses import dataclass, field
-from parser.utils import parse_docx
+from parser.utils import parse_docx, iter_json_lines, batch_iterable
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterable, List, Tuple
 from hashlib import md5
 import logging
 import json
 
+JSON_LINES_BATCH_SIZE = 1000
+
 
 @dataclass
 class CommonUnstructuredParams(CommonParams):
@@ -98,13 +100,54 @@ class TypeDParser(CommonUnstructuredParams):
             reads json files
             adds id to the id attribute
             calls parent parse method to write to file
+            json lines files are handed to parse_json_lines instead
+        build_content(record):
+            cleans the type d text and hashes the name into an id
+        iter_json_lines_records(generated_date):
+            lazily builds one output document per json lines record, logging malformed lines in line order
+        parse_json_lines():
+            streams records from a json lines file in batches of JSON_LINES_BATCH_SIZE,
+            writes one json document per line
         """
 
+    def build_content(self, record: Dict) -> Tuple[List, str]:
+        content = [record["type_d_text"].replace("\n", " ").strip()]
+        return content, md5(str.encode(record["name"])).hexdigest()
+
     def parse(self):
+        if self.file_type == "jsonl":
+            return self.parse_json_lines()
         with open(self.input_file, "r") as f:
             data = json.load(f)
-        self.content = [data["type_d_text"].replace("\n", " ").strip()]
+        self.content, self.data["id"] = self.build_content(data)
         print(self.content)
-        self.data["id"] = md5(str.encode(data["name"])).hexdigest()
         self.source_type = "type_d"
         super().parse()
+
+    def iter_json_lines_records(self, generated_date: str) -> Iterable[Dict]:
+        for line_number, record in iter_json_lines(self.input_file):
+            try:
+                content, record_id = self.build_content(record)
+            except (KeyError, TypeError, AttributeError) as e:
+                logging.warning(f"Skipping malformed record at line {line_number} in {self.input_file}: {e!r}")
+                continue
+            yield dict(self.data, generatedDate=generated_date, content=content, type="type_d", id=record_id)
+
+    def parse_json_lines(self):
+        logging.debug(f"Parsing json lines for {self.input_file}")
+        generated_date = datetime.now().strftime("%Y-%m-%d")
+        records = self.iter_json_lines_records(generated_date)
+        written = 0
+        output = None if self.dry_run else open(self.output_file, "w")
+        try:
+            for batch in batch_iterable(records, JSON_LINES_BATCH_SIZE):
+                if output is None:
+                    for data in batch:
+                        logging.info(data)
+                else:
+                    output.writelines(f"{json.dumps(data)}\n" for data in batch)
+                written += len(batch)
+        finally:
+            if output is not None:
+                output.close()
+        logging.debug(f"Parsed {written} records from {self.input_file}")
@@ -1,10 +1,11 @@
 from xml.etree.ElementTree import XML
 from dataclasses import _MISSING_TYPE
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Tuple, Iterable
 from argparse import Namespace
 from pandas import DataFrame
 from zipfile import ZipFile
 from pathlib import Path
+from random import Random
 import logging
 import json
 
@@ -60,6 +61,110 @@ def write_iterrow_to_json(df: DataFrame, output_path: Path):
         f.write(data)
 
 
+def count_csv_rows(file_path: Path, chunk_size: int = 1 << 20) -> int:
+    """
+    Counts data rows in a csv file by scanning raw bytes for newlines, without parsing it.
+    The header row is not counted.
+    """
+    rows = 0
+    last_chunk = b""
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            rows += chunk.count(b"\n")
+            last_chunk = chunk
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        rows += 1
+    return max(rows - 1, 0)
+
+
+def build_preview_read_kwargs(preview_rows: int, total_rows: int = None, sample: bool = False, seed: int = None) -> Dict:
+    """
+    Builds keyword arguments for a pandas reader so that only a preview of the file is parsed.
+
+    Parameters
+    ----------
+    preview_rows : int
+        number of rows to read
+    total_rows : int
+        number of data rows in the file, required to draw a random sample
+    sample : bool
+        if true, rows are drawn at random across the file instead of taken from the top
+    seed : int
+        seed for the random row selection, makes sampled previews reproducible
+
+    Returns
+    -------
+    Dict
+        nrows for a head preview, or a skiprows callable that keeps each data row with a probability
+        high enough to oversample preview_rows, to be trimmed with DataFrame.sample
+    """
+    if not sample:
+        return dict(nrows=preview_rows)
+    keep_probability = min(1, (2 * preview_rows + 100) / total_rows) if total_rows else 1
+    rng = Random(seed)
+    return dict(skiprows=lambda i: i > 0 and rng.random() > keep_probability)
+
+
+def log_preview(df: DataFrame, stage_timings: List[Tuple], preview_rows: int, total_rows: int = None, show_rows: int = 5):
+    """
+    Logs the output schema, the first few rows and the projected cost of a full run per pipeline stage.
+    stage_timings holds (stage, seconds, scaled) tuples. Scaled stages are projected linearly by
+    total_rows / preview_rows, unscaled stages already touched the whole file and are reported as-is.
+    Fixed per-call overhead is scaled along with the per-row cost, so projections are a rough upper bound.
+    """
+    logging.info(f"Preview output schema:\n{df.dtypes.to_string()}")
+    logging.info(f"Preview output rows:\n{df.head(show_rows)}")
+    scale = total_rows / preview_rows if total_rows and preview_rows else None
+    if scale is None:
+        logging.info("Total row count unknown for this file type, showing preview cost only")
+    else:
+        logging.info(
+            f"Projecting full run cost for {total_rows} rows from {preview_rows} previewed rows, "
+            f"projections are a rough upper bound"
+        )
+    total_seconds = 0
+    projected_seconds = 0
+    for stage, seconds, scaled in stage_timings:
+        total_seconds += seconds
+        if not scaled:
+            projected_seconds += seconds
+            logging.info(f" Stage {stage}: {seconds:.3f}s on preview, already covers the full file")
+            continue
+        if scale is not None:
+            projected_seconds += seconds * scale
+        projected = f", projected full run: {seconds * scale:.3f}s" if scale is not None else ""
+        logging.info(f" Stage {stage}: {seconds:.3f}s on preview{projected}")
+    projected = f", projected full run: {projected_seconds:.3f}s" if scale is not None else ""
+    logging.info(f" All stages: {total_seconds:.3f}s on preview{projected}")
+
+
+def iter_json_lines(file_path: Path) -> Iterable[Tuple[int, Dict]]:
+    """
+    Lazily yields (line number, record) for each line of a newline-delimited json file.
+    Blank lines are skipped, malformed lines, including ones that are not valid utf-8,
+    are logged with their line number and skipped.
+    """
+    with open(file_path, "rb") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line.decode("utf-8"))
+            except ValueError as e:
+                logging.warning(f"Skipping malformed line {line_number} in {file_path}: {e}")
+
+
+def batch_iterable(iterable: Iterable, batch_size: int) -> Iterable[List]:
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def parse_docx(file_path: Path) -> str:
     """
     NOTE: